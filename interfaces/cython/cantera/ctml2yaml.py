@@ -15,8 +15,9 @@ from pathlib import Path
 import sys
 import re
 import argparse
+import io
+from concurrent.futures import ProcessPoolExecutor
 
-import xml.etree.ElementTree as etree
 from email.utils import formatdate
 import warnings
 import copy
@@ -29,6 +30,33 @@ try:
 except ImportError:
     from ruamel import yaml
 
+try:
+    # PyYAML's LibYAML bindings serialize the output several times faster than the
+    # pure-Python ruamel.yaml emitter. They are optional, see create_emitter.
+    import yaml as pyyaml  # type: ignore
+    from yaml import CSafeDumper  # type: ignore
+
+    # The sort_keys option used to keep the order of the keys requires PyYAML >= 5.1
+    PYYAML_VERSION = tuple(int(v) for v in re.findall(r"\d+", pyyaml.__version__)[:2])
+    if PYYAML_VERSION < (5, 1):
+        CSafeDumper = None
+except ImportError:
+    CSafeDumper = None
+
+try:
+    from lxml import etree  # type: ignore
+
+    # The standard library parser drops comments and processing instructions, so
+    # iterating over the children of a node only returns elements. lxml keeps them
+    # unless told otherwise.
+    ITERPARSE_OPTIONS = {"remove_comments": True, "remove_pis": True}
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as etree  # type: ignore
+
+    ITERPARSE_OPTIONS = {}
+    HAS_LXML = False
+
 import numpy as np
 
 if TYPE_CHECKING:
@@ -45,26 +73,21 @@ if TYPE_CHECKING:
     DH_BETA_MATRIX = TypedDict(
         "DH_BETA_MATRIX", {"species": List[str], "beta": QUANTITY}, total=False
     )
-    ARRHENIUS_PARAMS = Dict[str, Union[str, QUANTITY]]
     EFFICIENCY_PARAMS = Dict[str, float]
-    LINDEMANN_PARAMS = Union[str, ARRHENIUS_PARAMS, EFFICIENCY_PARAMS]
+    LINDEMANN_PARAMS = Union[str, "RateConstant", EFFICIENCY_PARAMS]
     TROE_PARAMS = Dict[str, float]
     SRI_PARAMS = Dict[str, float]
-    COVERAGE_PARAMS = Dict[str, ARRHENIUS_PARAMS]
+    COVERAGE_PARAMS = Dict[str, Dict[str, QUANTITY]]
 
-    ARRHENIUS_TYPE = Dict[str, ARRHENIUS_PARAMS]
-    INTERFACE_TYPE = Dict[
-        str, Union[ARRHENIUS_PARAMS, bool, str, COVERAGE_PARAMS, float]
-    ]
+    ARRHENIUS_TYPE = Dict[str, "RateConstant"]
+    INTERFACE_TYPE = Dict[str, Union["RateConstant", bool, str, COVERAGE_PARAMS, float]]
     NESTED_LIST_OF_FLOATS = List[List[float]]
     CHEBYSHEV_TYPE = Dict[str, Union[List[float], NESTED_LIST_OF_FLOATS, str]]
-    PLOG_TYPE = Dict[str, Union[str, List[ARRHENIUS_PARAMS]]]
-    CHEMACT_TYPE = Dict[
-        str, Union[str, ARRHENIUS_PARAMS, EFFICIENCY_PARAMS, TROE_PARAMS]
-    ]
+    PLOG_TYPE = Dict[str, Union[str, List["RateConstant"]]]
+    CHEMACT_TYPE = Dict[str, Union[str, "RateConstant", EFFICIENCY_PARAMS, TROE_PARAMS]]
     LINDEMANN_TYPE = Dict[str, LINDEMANN_PARAMS]
     TROE_TYPE = Dict[str, Union[LINDEMANN_PARAMS, TROE_PARAMS]]
-    THREEBODY_TYPE = Dict[str, Union[ARRHENIUS_PARAMS, EFFICIENCY_PARAMS]]
+    THREEBODY_TYPE = Dict[str, Union["RateConstant", EFFICIENCY_PARAMS]]
     SRI_TYPE = Dict[str, Union[LINDEMANN_PARAMS, SRI_PARAMS]]
 
     THERMO_POLY_TYPE = Union[List[List[float]], List[float]]
@@ -151,27 +174,36 @@ class MissingNodeText(LookupError):
 # Improved float formatting requires Numpy >= 1.14
 HAS_FMT_FLT_POS = hasattr(np, "format_float_positional")
 
+# float2string is called for every floating point value in the output, so the check for
+# the NumPy version is done once, when the module is imported.
+if HAS_FMT_FLT_POS:
 
-def float2string(data: float) -> str:
-    """Format a float into a string.
+    def float2string(data: float) -> str:
+        """Format a float into a string.
 
-    :param data: The floating point data to be formatted.
+        :param data: The floating point data to be formatted.
 
-    Uses NumPy's ``format_float_positional()`` and ``format_float_scientific()`` if they
-    are is available, requires NumPy >= 1.14. In that case, values with magnitude
-    between 0.01 and 10000 are formatted using ``format_float_positional ()`` and other
-    values are formatted using ``format_float_scientific()``. If those NumPy functions
-    are not available, returns the ``repr`` of the input.
-    """
-    if not HAS_FMT_FLT_POS:
-        return repr(data)
+        Uses NumPy's ``format_float_scientific()`` if it is available, requires NumPy
+        >= 1.14. In that case, values with magnitude between 0.01 and 10000 are
+        formatted using their ``repr``, which gives the same shortest round-trip
+        digits as ``format_float_positional()`` at a fraction of the cost, and other
+        values are formatted using ``format_float_scientific()``. If those NumPy
+        functions are not available, returns the ``repr`` of the input.
+        """
+        if data == 0:
+            return "0.0"
+        elif 0.01 <= abs(data) < 10000:
+            # float.__repr__ also formats NumPy floating point scalars as plain numbers
+            return float.__repr__(data)
+        else:
+            return np.format_float_scientific(data, trim="0")
 
-    if data == 0:
-        return "0.0"
-    elif 0.01 <= abs(data) < 10000:
-        return np.format_float_positional(data, trim="0")
-    else:
-        return np.format_float_scientific(data, trim="0")
+
+else:
+
+    def float2string(data: float) -> str:
+        """Format a float into a string using its ``repr``."""
+        return repr(data)
 
 
 def represent_float(self: Any, data: Any) -> Any:
@@ -198,6 +230,27 @@ def represent_float(self: Any, data: Any) -> Any:
 yaml.RoundTripRepresenter.add_representer(float, represent_float)
 
 
+# Patterns used by convert_units to translate CTML units strings into the YAML syntax
+UNITS_PRODUCT_RE = re.compile(r"([A-Za-z])-([A-Za-z])")
+UNITS_POWER_RE = re.compile(r"([A-Za-z])([-\d])")
+
+
+def convert_units(units: str) -> str:
+    """Convert a units string from the CTML format to the YAML format.
+
+    :param units:
+        The units string from the ``units`` attribute of an XML node.
+
+    In CTML, multiplication of units is written with a ``-`` and powers of units
+    follow the unit directly, for example, ``cm3/mol-s``. The equivalent YAML units
+    string is ``cm^3/mol*s``. Units without any dashes or digits are returned as-is.
+    """
+    if "-" not in units and not any(c.isdigit() for c in units):
+        return units
+    units = UNITS_PRODUCT_RE.sub(r"\1*\2", units)
+    return UNITS_POWER_RE.sub(r"\1^\2", units)
+
+
 def get_float_or_quantity(node: etree.Element) -> "QUANTITY":
     """Process an XML node into a float value or a value with units.
 
@@ -218,11 +271,10 @@ def get_float_or_quantity(node: etree.Element) -> "QUANTITY":
 
     where the first value is a string and the second is a float.
     """
-    value = float(clean_node_text(node))
+    value = get_float(node)
     units = node.get("units", "")
     if units:
-        units = re.sub(r"([A-Za-z])-([A-Za-z])", r"\1*\2", units)
-        units = re.sub(r"([A-Za-z])([-\d])", r"\1^\2", units)
+        units = convert_units(units)
         return "{} {}".format(float2string(value), units)
     else:
         return value
@@ -242,6 +294,14 @@ def split_species_value_string(node: etree.Element) -> Dict[str, float]:
     ``base/stringUtils.cpp``.
     """
     text = clean_node_text(node)
+    # Most strings only contain whitespace-separated "name:value" pairs, which can be
+    # split directly. Everything else is handled by the general algorithm below. Like
+    # that algorithm, rpartition keeps any colons in the species name.
+    if "," not in text and ";" not in text:
+        tokens = [token.rpartition(":") for token in text.split()]
+        if all(colon and value for _, colon, value in tokens):
+            return FlowMap((name, float(value)) for name, _, value in tokens)
+
     pairs = FlowMap({})
     start, stop, left = 0, 0, 0
     # \S matches the first non-whitespace character
@@ -303,6 +363,55 @@ def clean_node_text(node: etree.Element) -> str:
     return text.replace("\n", " ").replace("\t", " ").strip()
 
 
+def split_node_text(node: etree.Element, sep: Optional[str] = None) -> List[str]:
+    """Split the text of a node into a list of strings.
+
+    :param node:
+        An XML node with a text value.
+    :param sep:
+        The delimiter to split the text on. By default, the text is split on any
+        whitespace, including newlines and tabs.
+
+    Raises `MissingNodeText` if the node text is not present. Unlike
+    `clean_node_text`, the text is not copied before splitting it. When ``sep`` is
+    given, the items in the list may have surrounding whitespace.
+    """
+    text = node.text
+    if text is None:
+        raise MissingNodeText("The text of the node must exist", node)
+    return text.split(sep)
+
+
+def get_float(node: etree.Element) -> float:
+    """Parse the text of a node into a float.
+
+    :param node:
+        An XML node whose text is a single number.
+
+    Raises `MissingNodeText` if the node text is not present. `float` ignores the
+    whitespace surrounding the value, including newlines and tabs, so the text is
+    converted without cleaning it first.
+    """
+    text = node.text
+    if text is None:
+        raise MissingNodeText("The text of the node must exist", node)
+    return float(text)
+
+
+def get_float_array(node: etree.Element) -> List[float]:
+    """Parse the comma-separated values in the text of a node into a list of floats.
+
+    :param node:
+        An XML node whose text is a comma-separated list of numbers, such as a
+        ``floatArray`` node.
+
+    Raises `MissingNodeText` if the node text is not present. `float` ignores the
+    whitespace surrounding each value, including newlines and tabs, so the text does
+    not need to be cleaned before it is split.
+    """
+    return list(map(float, split_node_text(node, ",")))
+
+
 class Phase:
     thermo_model_mapping = {
         "IdealGas": "ideal-gas",
@@ -525,7 +634,7 @@ class Phase:
                     phase_thermo,
                 )
             self.attribs["composition"] = {}
-            for phase_ratio in clean_node_text(lattice_stoich_node).split():
+            for phase_ratio in split_node_text(lattice_stoich_node):
                 p_name, ratio = phase_ratio.rsplit(":", 1)
                 self.attribs["composition"][p_name.strip()] = float(ratio)
         elif phase_thermo_model == "Margules":
@@ -675,7 +784,7 @@ class Phase:
             }  # type: Dict[str, List[Union[str, QUANTITY]]]
             excess_enthalpy_node = binary_params.find("excessEnthalpy")
             if excess_enthalpy_node is not None:
-                excess_enthalpy = clean_node_text(excess_enthalpy_node).split(",")
+                excess_enthalpy = split_node_text(excess_enthalpy_node, ",")
                 enthalpy_units = excess_enthalpy_node.get("units", "")
                 if not enthalpy_units:
                     this_node["excess-enthalpy"] = FlowList(map(float, excess_enthalpy))
@@ -685,7 +794,7 @@ class Phase:
                     )
             excess_entropy_node = binary_params.find("excessEntropy")
             if excess_entropy_node is not None:
-                excess_entropy = clean_node_text(excess_entropy_node).split(",")
+                excess_entropy = split_node_text(excess_entropy_node, ",")
                 entropy_units = excess_entropy_node.get("units", "")
                 if not entropy_units:
                     this_node["excess-entropy"] = FlowList(map(float, excess_entropy))
@@ -696,7 +805,7 @@ class Phase:
 
             excessvol_enth_node = binary_params.find("excessVolume_Enthalpy")
             if excessvol_enth_node is not None:
-                excess_vol_enthalpy = clean_node_text(excessvol_enth_node).split(",")
+                excess_vol_enthalpy = split_node_text(excessvol_enth_node, ",")
                 enthalpy_units = excessvol_enth_node.get("units", "")
                 if not enthalpy_units:
                     this_node["excess-volume-enthalpy"] = FlowList(
@@ -711,7 +820,7 @@ class Phase:
                     )
             excessvol_entr_node = binary_params.find("excessVolume_Entropy")
             if excessvol_entr_node is not None:
-                excess_vol_entropy = clean_node_text(excessvol_entr_node).split(",")
+                excess_vol_entropy = split_node_text(excessvol_entr_node, ",")
                 entropy_units = excessvol_entr_node.get("units", "")
                 if not entropy_units:
                     this_node["excess-volume-entropy"] = FlowList(
@@ -763,7 +872,7 @@ class Phase:
             }  # type: Dict[str, List[Union[str, QUANTITY]]]
             excess_enthalpy_node = binary_params.find("excessEnthalpy")
             if excess_enthalpy_node is not None:
-                excess_enthalpy = clean_node_text(excess_enthalpy_node).split(",")
+                excess_enthalpy = split_node_text(excess_enthalpy_node, ",")
                 enthalpy_units = excess_enthalpy_node.get("units", "")
                 if not enthalpy_units:
                     this_node["excess-enthalpy"] = FlowList(map(float, excess_enthalpy))
@@ -773,7 +882,7 @@ class Phase:
                     )
             excess_entropy_node = binary_params.find("excessEntropy")
             if excess_entropy_node is not None:
-                excess_entropy = clean_node_text(excess_entropy_node).split(",")
+                excess_entropy = split_node_text(excess_entropy_node, ",")
                 entropy_units = excess_entropy_node.get("units", "")
                 if not entropy_units:
                     this_node["excess-entropy"] = FlowList(map(float, excess_entropy))
@@ -865,10 +974,9 @@ class Phase:
                 )
 
             pure_a_units = pure_a_node.get("units")
-            pure_a = [float(a) for a in clean_node_text(pure_a_node).split(",")]
+            pure_a = [float(a) for a in split_node_text(pure_a_node, ",")]
             if pure_a_units is not None:
-                pure_a_units = re.sub(r"([A-Za-z])-([A-Za-z])", r"\1*\2", pure_a_units)
-                pure_a_units = re.sub(r"([A-Za-z])([-\d])", r"\1^\2", pure_a_units)
+                pure_a_units = convert_units(pure_a_units)
 
                 eq_of_state["a"] = FlowList()
                 eq_of_state["a"].append(
@@ -912,10 +1020,9 @@ class Phase:
                 )
 
             cross_a_unit = cross_a_node.get("units")
-            cross_a = [float(a) for a in clean_node_text(cross_a_node).split(",")]
+            cross_a = [float(a) for a in split_node_text(cross_a_node, ",")]
             if cross_a_unit is not None:
-                cross_a_unit = re.sub(r"([A-Za-z])-([A-Za-z])", r"\1*\2", cross_a_unit)
-                cross_a_unit = re.sub(r"([A-Za-z])([-\d])", r"\1^\2", cross_a_unit)
+                cross_a_unit = convert_units(cross_a_unit)
 
                 cross_a_w_units = []
                 cross_a_w_units.append(
@@ -924,15 +1031,11 @@ class Phase:
                 cross_a_w_units.append(
                     "{} {}".format(float2string(cross_a[1]), cross_a_unit + "/K^0.5")
                 )
-                species_1["binary-a"].update(
-                    {species_2_name: FlowList(cross_a_w_units)}
-                )
-                species_2["binary-a"].update(
-                    {species_1_name: FlowList(cross_a_w_units)}
-                )
+                species_1["binary-a"][species_2_name] = FlowList(cross_a_w_units)
+                species_2["binary-a"][species_1_name] = FlowList(cross_a_w_units)
             else:
-                species_1["binary-a"].update({species_2_name: FlowList(cross_a)})
-                species_2["binary-a"].update({species_1_name: FlowList(cross_a)})
+                species_1["binary-a"][species_2_name] = FlowList(cross_a)
+                species_2["binary-a"][species_1_name] = FlowList(cross_a)
 
         for node in this_phase_species:
             for datasrc, species_names in node.items():
@@ -1016,7 +1119,7 @@ class Phase:
         extension to ``.yaml``. If the data source ``id`` is ``species_data``, reformat
         to just ``species`` for the YAML file. Otherwise, retain the ``id`` as-is.
         """
-        species_list = FlowList(clean_node_text(speciesArray_node).split())
+        species_list = FlowList(split_node_text(speciesArray_node))
         datasrc = speciesArray_node.get("datasrc", "")
         if datasrc == "#species_data":
             new_datasrc = "species"
@@ -1184,14 +1287,14 @@ class Phase:
         tab_thermo["units"] = FlowMap(
             {"energy": entropy_units[0], "quantity": entropy_units[1]}
         )
-        enthalpy = clean_node_text(enthalpy_node).split(",")
+        enthalpy = split_node_text(enthalpy_node, ",")
         if len(enthalpy) != int(enthalpy_node.get("size", 0)):
             raise ValueError(
                 "The number of entries in the enthalpy list is different from the "
                 "indicated size."
             )
         tab_thermo["enthalpy"] = FlowList(map(float, enthalpy))
-        entropy = clean_node_text(entropy_node).split(",")
+        entropy = split_node_text(entropy_node, ",")
         tab_thermo["entropy"] = FlowList(map(float, entropy))
         if len(entropy) != int(entropy_node.get("size", 0)):
             raise ValueError(
@@ -1204,7 +1307,7 @@ class Phase:
                 "The 'tabulatedThermo' node must have a 'moleFraction' node.",
                 tab_thermo_node,
             )
-        mole_fraction = clean_node_text(mole_fraction_node).split(",")
+        mole_fraction = split_node_text(mole_fraction_node, ",")
         tab_thermo["mole-fractions"] = FlowList(map(float, mole_fraction))
         if len(mole_fraction) != int(mole_fraction_node.get("size", 0)):
             raise ValueError(
@@ -1257,7 +1360,7 @@ class Phase:
                 continue
             this_interaction = {"species": FlowList([i[1] for i in inter_node.items()])}
             for param_node in inter_node:
-                data = clean_node_text(param_node).split(",")
+                data = split_node_text(param_node, ",")
                 param_name = param_node.tag.lower()
                 if param_name == "cphi":
                     param_name = "Cphi"
@@ -1340,7 +1443,7 @@ class Phase:
                 else:
                     activity_data["default-ionic-radius"] = float(default_radius)
             if ionic_radius_node.text is not None:
-                radii = clean_node_text(ionic_radius_node).split()
+                radii = split_node_text(ionic_radius_node)
                 for r in radii:
                     species_name, radius = r.strip().rsplit(":", 1)
                     if radius_units is not None:
@@ -1353,7 +1456,7 @@ class Phase:
         if beta_matrix_node is not None:
             beta_matrix = []
             beta_units = beta_matrix_node.get("units")
-            for beta_text in clean_node_text(beta_matrix_node).split():
+            for beta_text in split_node_text(beta_matrix_node):
                 # The C++ code to process this matrix from XML assumes that the species
                 # names in this matrix do not contain colons, so we retain that
                 # behavior here.
@@ -1362,8 +1465,7 @@ class Phase:
                     "species": FlowList([species_1, species_2])
                 }  # type: DH_BETA_MATRIX
                 if beta_units is not None:
-                    beta_units = re.sub(r"([A-Za-z])-([A-Za-z])", r"\1*\2", beta_units)
-                    beta_units = re.sub(r"([A-Za-z])([-\d])", r"\1^\2", beta_units)
+                    beta_units = convert_units(beta_units)
                     beta_dict["beta"] = beta_value + " " + beta_units
                 else:
                     beta_dict["beta"] = float(beta_value)
@@ -1375,7 +1477,7 @@ class Phase:
         ionic_strength_mods_node = activity_node.find("stoichIsMods")
         is_mods = {}
         if ionic_strength_mods_node is not None:
-            mods = clean_node_text(ionic_strength_mods_node).split()
+            mods = split_node_text(ionic_strength_mods_node)
             for m in mods:
                 species_name, mod = m.strip().rsplit(":", 1)
                 is_mods[species_name] = float(mod)
@@ -1383,7 +1485,7 @@ class Phase:
         electrolyte_species_type_node = activity_node.find("electrolyteSpeciesType")
         etype_mods = {}
         if electrolyte_species_type_node is not None:
-            mods = clean_node_text(electrolyte_species_type_node).split()
+            mods = split_node_text(electrolyte_species_type_node)
             for m in mods:
                 species_name, mod = m.strip().rsplit(":", 1)
                 etype_mods[species_name] = mod
@@ -1495,9 +1597,7 @@ class SpeciesThermo:
                 raise MissingXMLNode(
                     "'{}' entry missing 'floatArray' node.".format(poly_type), node
                 )
-            unsorted_data[Tmin] = FlowList(
-                map(float, clean_node_text(float_array).split(","))
-            )
+            unsorted_data[Tmin] = FlowList(get_float_array(float_array))
 
         if len(temperature_ranges) != len(model_nodes) + 1:
             raise ValueError(
@@ -1605,11 +1705,11 @@ class SpeciesThermo:
                     thermo_attribs["dimensionless"] = True
                     dimensions = ""
                 values = []  # type: Union[Iterable[float], Iterable[str]]
-                values = map(float, clean_node_text(float_node).split(","))
+                values = map(float, split_node_text(float_node, ","))
                 if dimensions:
                     values = [float2string(v) + " " + dimensions for v in values]
             elif title == "Mu0Temperatures":
-                temperatures = map(float, clean_node_text(float_node).split(","))
+                temperatures = map(float, split_node_text(float_node, ","))
 
         thermo_attribs["data"] = dict(zip(temperatures, values))
 
@@ -1658,19 +1758,26 @@ class SpeciesTransport:
                 "Unknown transport model type: '{}'".format(transport.get("model"))
             )
         self.attribs["model"] = self.species_transport_mapping[transport_model]
-        self.attribs["geometry"] = transport.findtext("string[@title='geometry']")
+        # The geometry is found while looping over the child nodes below, so that
+        # the children are only scanned once. Set the key here so that it comes
+        # before the transport properties in the output.
+        self.attribs["geometry"] = geometry = None
+        properties_mapping = self.transport_properties_mapping
         for prop_node in transport:
             if prop_node.tag == "string":
+                if geometry is None and prop_node.get("title") == "geometry":
+                    geometry = prop_node.text or ""
                 continue
             # Don't use get_float_or_units because the units of the gas_transport
             # parameters are assumed to be customary units in YAML.
-            value = float(clean_node_text(prop_node))
-            name = self.transport_properties_mapping.get(prop_node.tag)
+            value = get_float(prop_node)
+            name = properties_mapping.get(prop_node.tag)
             if name is None:
                 raise TypeError(
                     "Unknown transport property node: '{}'".format(prop_node.tag)
                 )
             self.attribs[name] = value
+        self.attribs["geometry"] = geometry
 
     @classmethod
     def to_yaml(cls, representer, data):
@@ -1732,7 +1839,7 @@ class Species:
 
         charge_node = species_node.find("charge")
         if charge_node is not None:
-            charge = float(clean_node_text(charge_node))
+            charge = get_float(charge_node)
             if charge != 0.0:
                 self.attribs["composition"]["E"] = -1 * charge
 
@@ -1760,7 +1867,7 @@ class Species:
                         thermo,
                     )
                 species_multipliers = FlowMap({})
-                neutral_spec_mult = clean_node_text(neutral_spec_mult_node).split()
+                neutral_spec_mult = split_node_text(neutral_spec_mult_node)
                 for spec_mult in neutral_spec_mult:
                     species, multiplier = spec_mult.rsplit(":", 1)
                     species_multipliers[species] = float(multiplier)
@@ -1891,14 +1998,13 @@ class Species:
                     raise MissingXMLNode(
                         "The 'floatArray' node must be specified", std_state
                     )
-                values = clean_node_text(poly_values_node).split(",")
+                values = split_node_text(poly_values_node, ",")
 
                 poly_units = poly_values_node.get("units", "")
                 if not poly_units:
                     eqn_of_state["data"] = FlowList(map(float, values))
                 else:
-                    poly_units = re.sub(r"([A-Za-z])-([A-Za-z])", r"\1*\2", poly_units)
-                    poly_units = re.sub(r"([A-Za-z])([-\d])", r"\1^\2", poly_units)
+                    poly_units = convert_units(poly_units)
 
                     # Need to put units on each term in the polynomial because we can't
                     # reliably parse the units attribute string into a mass and a length
@@ -1928,7 +2034,75 @@ class Species:
         return representer.represent_dict(data.attribs)
 
 
+class RateConstant:
+    __slots__ = ("A", "b", "Ea", "P")
+
+    def __init__(self, A: "QUANTITY", b: "QUANTITY", Ea: "QUANTITY"):
+        """Represent the parameters of a modified Arrhenius rate constant.
+
+        :param A:
+            The pre-exponential factor.
+        :param b:
+            The temperature exponent.
+        :param Ea:
+            The activation energy.
+
+        A mechanism can contain thousands of rate constants, so this class uses
+        ``__slots__`` instead of storing the parameters in a mapping. The pressure
+        ``P`` is only set for the rate constants of a PLOG reaction.
+        """
+        self.A = A
+        self.b = b
+        self.Ea = Ea
+        self.P = None  # type: Optional[QUANTITY]
+
+    @classmethod
+    def to_yaml(cls, representer, data):
+        """Serialize the class instance to YAML format.
+
+        :param representer:
+            An instance of a ruamel.yaml or PyYAML representer type.
+        :param data:
+            An instance of this class that will be serialized.
+
+        The parameters are written as a flow-style mapping with the keys ``A``, ``b``,
+        ``Ea``, and ``P``, where ``P`` is omitted if it is not set.
+        """
+        params = {"A": data.A, "b": data.b, "Ea": data.Ea}
+        if data.P is not None:
+            params["P"] = data.P
+        return representer.represent_mapping(
+            "tag:yaml.org,2002:map", params, flow_style=True
+        )
+
+
 class Reaction:
+    reaction_type_mapping = {
+        "arrhenius": "arrhenius",
+        "elementary": "arrhenius",
+        "threebody": "threebody",
+        "three_body": "threebody",
+        "falloff": "falloff",
+        "chemact": "chemact",
+        "chemically_activated": "chemact",
+        "plog": "plog",
+        "pdep_arrhenius": "plog",
+        "chebyshev": "chebyshev",
+        "interface": "interface",
+        "edge": "interface",
+        "surface": "interface",
+        "global": "interface",
+        "electrochemical": "interface",
+        "butlervolmer_noactivitycoeffs": "butlervolmer",
+        "butlervolmer": "butlervolmer",
+        "surfaceaffinity": "butlervolmer",
+    }
+    falloff_type_mapping = {"Lindemann": "lindemann", "Troe": "troe", "SRI": "sri"}
+    # Names of the parameters in the 'falloff' node, in the order they are given
+    troe_names = ("A", "T3", "T1", "T2")
+    sri_names = ("A", "B", "C", "D", "E")
+    arrhenius_tag_mapping = {"A": "A", "b": "b", "E": "Ea"}
+
     def __init__(self, reaction: etree.Element, node_motz_wise: bool):
         """Represent an XML ``reaction`` node.
 
@@ -1971,26 +2145,33 @@ class Reaction:
             raise MissingXMLNode(
                 "The 'reaction' node must have a 'rateCoeff' node.", reaction
             )
-        if reaction_type in ["arrhenius", "elementary"]:
-            reaction_type = "arrhenius"
-        elif reaction_type in ["threebody", "three_body"]:
-            reaction_type = "threebody"
-        elif reaction_type == "falloff":
+        # Look up how this type of reaction is processed. The values are the names of
+        # the methods that process them, except for "falloff", which is resolved to a
+        # method using the type of the 'falloff' node, and "butlervolmer", which is
+        # processed as an interface reaction after warning about the parameters
+        # that are dropped.
+        rate_type = self.reaction_type_mapping.get(reaction_type)
+        if rate_type is None:
+            raise TypeError(
+                "Unknown reaction type '{}' for reaction id '{}'".format(
+                    reaction_type, reaction.get("id")
+                )
+            )
+        elif rate_type == "falloff":
             falloff_node = rate_coeff.find("falloff")
             if falloff_node is None:
                 raise MissingXMLNode(
                     "Falloff reaction types must have a 'falloff' node.", rate_coeff
                 )
             falloff_type = falloff_node.get("type")
-            if falloff_type not in ["Lindemann", "Troe", "SRI"]:
+            rate_type = self.falloff_type_mapping.get(falloff_type)
+            if rate_type is None:
                 raise TypeError(
                     "Unknown falloff type '{}' for reaction id '{}'".format(
                         falloff_type, reaction.get("id")
                     )
                 )
-            else:
-                reaction_type = falloff_type
-        elif reaction_type in ["chemact", "chemically_activated"]:
+        elif rate_type == "chemact":
             falloff_node = rate_coeff.find("falloff")
             if falloff_node is None:
                 raise MissingXMLNode(
@@ -2003,26 +2184,7 @@ class Reaction:
                         falloff_type, reaction.get("id")
                     )
                 )
-        elif reaction_type in ["plog", "pdep_arrhenius"]:
-            reaction_type = "plog"
-        elif reaction_type == "chebyshev":
-            # There's only one way to spell Chebyshev, so no need to change anything
-            # However, we need to catch this case so it doesn't raise the TypeError
-            # in the else clause
-            pass
-        elif reaction_type in [
-            "interface",
-            "edge",
-            "surface",
-            "global",
-            "electrochemical",
-        ]:
-            reaction_type = "interface"
-        elif reaction_type in [
-            "butlervolmer_noactivitycoeffs",
-            "butlervolmer",
-            "surfaceaffinity",
-        ]:
+        elif rate_type == "butlervolmer":
             warnings.warn(
                 "Butler-Volmer parameters are not supported in the YAML "
                 "format. If this is an important feature to you, please see the "
@@ -2030,14 +2192,8 @@ class Reaction:
                 "https://github.com/Cantera/cantera/issues/749\n"
                 "https://github.com/Cantera/cantera/pulls/750"
             )
-            reaction_type = "interface"
-        else:
-            raise TypeError(
-                "Unknown reaction type '{}' for reaction id '{}'".format(
-                    reaction_type, reaction.get("id")
-                )
-            )
-        func = getattr(self, reaction_type.lower())
+            rate_type = "interface"
+        func = getattr(self, rate_type)
         self.attribs.update(func(rate_coeff))
 
         if node_motz_wise and self.attribs.get("Motz-Wise") is None:
@@ -2061,7 +2217,14 @@ class Reaction:
                     order_node,
                 )
             order = get_float_or_quantity(order_node)
-            if species not in reactants or not np.isclose(reactants[species], order):
+            # Same tolerances as numpy.isclose, without the overhead of calling a
+            # ufunc for two scalars. An order with units can't be compared to the
+            # stoichiometric coefficient, so it is always kept.
+            if (
+                species not in reactants
+                or not isinstance(order, float)
+                or abs(reactants[species] - order) > 1e-8 + 1e-5 * abs(order)
+            ):
                 orders[species] = order
         if orders:
             self.attribs["orders"] = orders
@@ -2100,12 +2263,10 @@ class Reaction:
         falloff_node = rate_coeff.find("falloff")
         if falloff_node is None:
             raise MissingXMLNode("SRI reaction requires 'falloff' node", rate_coeff)
-        SRI_names = list("ABCDE")
-        SRI_data = FlowMap({})
-        for name, param in zip(SRI_names, clean_node_text(falloff_node).split()):
-            SRI_data[name] = float(param)
-
-        reaction_attribs["SRI"] = SRI_data
+        reaction_attribs["SRI"] = FlowMap(
+            (name, float(param))
+            for name, param in zip(self.sri_names, split_node_text(falloff_node))
+        )
         return reaction_attribs
 
     def threebody(self, rate_coeff: etree.Element) -> "THREEBODY_TYPE":
@@ -2162,14 +2323,13 @@ class Reaction:
             raise MissingXMLNode(
                 "Troe reaction types must include a 'falloff' node", rate_coeff
             )
-        troe_params = clean_node_text(troe_node).split()
-        troe_names = ["A", "T3", "T1", "T2"]
-        reaction_attribs["Troe"] = FlowMap()
+        troe_params = split_node_text(troe_node)
         # zip stops when the shortest iterable is exhausted. If T2 is not present
         # in the Troe parameters (i.e., troe_params is three elements long), it
         # will be omitted here as well.
-        for name, param in zip(troe_names, troe_params):
-            reaction_attribs["Troe"].update({name: float(param)})  # type: ignore
+        reaction_attribs["Troe"] = FlowMap(
+            (name, float(param)) for name, param in zip(self.troe_names, troe_params)
+        )
 
         return reaction_attribs
 
@@ -2201,14 +2361,13 @@ class Reaction:
                 "Chemically activated reaction types must include a 'falloff' node",
                 rate_coeff,
             )
-        troe_params = clean_node_text(troe_node).split()
-        troe_names = ["A", "T3", "T1", "T2"]
-        reaction_attribs["Troe"] = FlowMap()
+        troe_params = split_node_text(troe_node)
         # zip stops when the shortest iterable is exhausted. If T2 is not present
         # in the Troe parameters (i.e., troe_params is three elements long), it
         # will be omitted here as well.
-        for name, param in zip(troe_names, troe_params):
-            reaction_attribs["Troe"].update({name: float(param)})
+        reaction_attribs["Troe"] = FlowMap(
+            (name, float(param)) for name, param in zip(self.troe_names, troe_params)
+        )
 
         return reaction_attribs
 
@@ -2227,7 +2386,7 @@ class Reaction:
                 raise MissingXMLNode(
                     "A 'plog' reaction must have a 'P' node.", arr_coeff
                 )
-            rate_constant["P"] = get_float_or_quantity(P_node)
+            rate_constant.P = get_float_or_quantity(P_node)
             rate_constants.append(rate_constant)
         reaction_attributes["rate-constants"] = rate_constants
 
@@ -2276,17 +2435,16 @@ class Reaction:
                 "attributes.",
                 data_node,
             )
-        raw_data = [float(a) for a in clean_node_text(data_node).split(",")]
-        data = []
-        for i in range(0, len(raw_data), n_p_values):
-            data.append(FlowList(raw_data[i : i + n_p_values]))
-
-        if len(data) != n_T_values:
+        raw_data = get_float_array(data_node)
+        if len(raw_data) != n_T_values * n_p_values:
             raise ValueError(
                 "The number of coefficients in the Chebyshev data do not match the "
                 "specified temperature and pressure degrees."
             )
-        reaction_attributes["data"] = data
+        reaction_attributes["data"] = [
+            FlowList(raw_data[i : i + n_p_values])
+            for i in range(0, len(raw_data), n_p_values)
+        ]
 
         return reaction_attributes
 
@@ -2371,7 +2529,7 @@ class Reaction:
 
     def process_arrhenius_parameters(
         self, arr_node: Optional[etree.Element]
-    ) -> "ARRHENIUS_PARAMS":
+    ) -> RateConstant:
         """Process the parameters from an ``Arrhenius`` child of a ``rateCoeff`` node.
 
         :param arr_node:
@@ -2380,21 +2538,23 @@ class Reaction:
         """
         if arr_node is None:
             raise MissingXMLNode("The 'Arrhenius' node must be present.")
-        A_node = arr_node.find("A")
-        b_node = arr_node.find("b")
-        E_node = arr_node.find("E")
-        if A_node is None or b_node is None or E_node is None:
+        # Collect the parameter nodes in one pass over the children. Like find(), the
+        # first node with each tag is used.
+        param_nodes = {}  # type: Dict[str, etree.Element]
+        for child in arr_node:
+            key = self.arrhenius_tag_mapping.get(child.tag)
+            if key is not None and key not in param_nodes:
+                param_nodes[key] = child
+        if len(param_nodes) != len(self.arrhenius_tag_mapping):
             raise MissingXMLNode(
                 "All of 'A', 'b', and 'E' must be specified for the 'Arrhenius' "
                 "parameters.",
                 arr_node,
             )
-        return FlowMap(
-            {
-                "A": get_float_or_quantity(A_node),
-                "b": get_float_or_quantity(b_node),
-                "Ea": get_float_or_quantity(E_node),
-            }
+        return RateConstant(
+            get_float_or_quantity(param_nodes["A"]),
+            get_float_or_quantity(param_nodes["b"]),
+            get_float_or_quantity(param_nodes["Ea"]),
         )
 
     def process_efficiencies(self, eff_node: etree.Element) -> "EFFICIENCY_PARAMS":
@@ -2404,8 +2564,18 @@ class Reaction:
             The XML efficiency node. The text of the node must be a space-delimited
             string of ``species:value`` pairs.
         """
-        efficiencies = [eff.rsplit(":", 1) for eff in clean_node_text(eff_node).split()]
-        return FlowMap({s: float(e) for s, e in efficiencies})
+        efficiencies = FlowMap()
+        for pair in split_node_text(eff_node):
+            # Species names can contain colons, so the value is everything after the
+            # last colon. rpartition is used instead of rsplit to avoid creating a
+            # list for every pair.
+            species, colon, value = pair.rpartition(":")
+            if not colon:
+                raise ValueError(
+                    "Efficiency '{}' is not a species:value pair".format(pair)
+                )
+            efficiencies[species] = float(value)
+        return efficiencies
 
 
 def create_species_from_data_node(ctml_tree: etree.Element) -> Dict[str, List[Species]]:
@@ -2424,6 +2594,9 @@ def create_species_from_data_node(ctml_tree: etree.Element) -> Dict[str, List[Sp
 
     If ``speciesData`` nodes with the same ``id`` attribute are found, only the first
     section with that ``id`` is put into the YAML output file.
+
+    This function works on a fully parsed XML tree. `convert` uses `parse_ctml`
+    instead, which creates the `Species` instances while the document is parsed.
     """
     species = {}  # type: Dict[str, List[Species]]
     for species_data_node in ctml_tree.iterfind("speciesData"):
@@ -2459,6 +2632,9 @@ def create_reactions_from_data_node(
 
     If ``reactionData`` nodes with the same ``id`` attribute are found, only the first
     section with that ``id`` is put into the YAML output file.
+
+    This function works on a fully parsed XML tree. `convert` uses `parse_ctml`
+    instead, which creates the `Reaction` instances while the document is parsed.
     """
     reactions = {}  # type: Dict[str, List[Reaction]]
     for reactionData_node in ctml_tree.iterfind("reactionData"):
@@ -2479,6 +2655,101 @@ def create_reactions_from_data_node(
     return reactions
 
 
+def parse_ctml(
+    ctml_text: str,
+) -> Tuple[etree.Element, Dict[str, List[Species]], Dict[str, List[Reaction]]]:
+    """Parse CTML text, creating `Species` and `Reaction` instances while reading.
+
+    :param ctml_text:
+        The content of the CTML document.
+
+    The document is parsed incrementally. Each ``species`` child of a ``speciesData``
+    node and each ``reaction`` child of a ``reactionData`` node is converted to a
+    `Species` or `Reaction` instance as soon as the parser reaches its end tag, and
+    the XML node is then cleared and removed from the tree. This way, the full XML tree
+    of a large mechanism never has to be held in memory at the same time as the
+    converted data.
+
+    Returns a tuple of the root XML node of the document, which retains the ``phase``
+    nodes and other top-level nodes, and two dictionaries mapping the ``id``
+    attributes of the ``speciesData`` and ``reactionData`` nodes to lists of `Species`
+    and `Reaction` instances, respectively. The ``id`` attribute is also used as the
+    top-level key in the YAML document for that set of species or reactions, with the
+    exception that ``species_data`` is changed to just ``species`` and
+    ``reaction_data`` is changed to just ``reactions``.
+
+    If ``speciesData`` or ``reactionData`` nodes with the same ``id`` attribute are
+    found, only the first section with that ``id`` is put into the YAML output file.
+    """
+    species = {}  # type: Dict[str, List[Species]]
+    reactions = {}  # type: Dict[str, List[Reaction]]
+    # The speciesData or reactionData node that is being read, the list that its
+    # converted children are added to (None for a duplicate section), and the last
+    # child node that was converted.
+    data_node = None  # type: Optional[etree.Element]
+    data_list = None  # type: Optional[List[Any]]
+    previous_node = None  # type: Optional[etree.Element]
+    node_motz_wise = False
+    depth = 0
+    # The text has already been decoded and is passed to the parser encoded as UTF-8,
+    # so the parser must not use the encoding named in the XML declaration.
+    # ElementTree parsers can only be used once, so a new one is created each time.
+    if HAS_LXML:
+        encoding_options = {"encoding": "utf-8"}  # type: Dict[str, Any]
+    else:
+        encoding_options = {"parser": etree.XMLParser(encoding="utf-8")}
+    context = etree.iterparse(
+        io.BytesIO(ctml_text.encode("utf-8")),
+        events=("start", "end"),
+        **encoding_options,
+        **ITERPARSE_OPTIONS
+    )
+    for event, node in context:
+        if event == "start":
+            depth += 1
+            if depth != 2 or node.tag not in ["speciesData", "reactionData"]:
+                continue
+            data_node = node
+            this_data_node_id = node.get("id", "")
+            if node.tag == "speciesData":
+                data_dict = species  # type: Dict[str, List[Any]]
+            else:
+                data_dict = reactions
+                node_motz_wise = node.get("motz_wise", "").lower() == "true"
+            if this_data_node_id in data_dict:
+                warnings.warn(
+                    "Duplicate '{}' id found: '{}'. Only the first section will be "
+                    "included in the output file.".format(node.tag, this_data_node_id)
+                )
+                data_list = None
+            else:
+                data_list = data_dict[this_data_node_id] = []
+            continue
+
+        depth -= 1
+        if data_node is None:
+            continue
+        if depth == 1:
+            # End of the speciesData or reactionData node. All of its children have
+            # been converted, so they can be dropped.
+            node.clear()
+            data_node = previous_node = None
+        elif depth == 2:
+            if data_list is not None:
+                if data_node.tag == "speciesData" and node.tag == "species":
+                    data_list.append(Species(node))
+                elif data_node.tag == "reactionData" and node.tag == "reaction":
+                    data_list.append(Reaction(node, node_motz_wise))
+            # The parser may still refer to the current node, so only the previous
+            # sibling is removed from the tree here.
+            node.clear()
+            if previous_node is not None:
+                data_node.remove(previous_node)
+            previous_node = node
+
+    return context.root, species, reactions
+
+
 def create_phases_from_data_node(
     ctml_tree: etree.Element,
     species_data: Dict[str, List[Species]],
@@ -2510,10 +2781,119 @@ def create_phases_from_data_node(
     return phases
 
 
+# The classes with a to_yaml method that are registered with the emitters
+CONVERSION_CLASSES = (
+    Phase,
+    Species,
+    SpeciesThermo,
+    SpeciesTransport,
+    Reaction,
+    RateConstant,
+)
+
+if CSafeDumper is not None:
+
+    class LibYAMLDumper(CSafeDumper):
+        """A PyYAML dumper that serializes the conversion classes using LibYAML.
+
+        The flow style of the ruamel.yaml ``CommentedMap`` and ``CommentedSeq``
+        instances created by `FlowMap`, `BlockMap`, and `FlowList` is kept. Objects
+        that appear more than once in the output are written out in full each time,
+        like they are by `convert`, which dumps one entry at a time.
+        """
+
+        def ignore_aliases(self, data: Any) -> bool:
+            return True
+
+        def represent_commented_map(self, data: Any) -> Any:
+            return self.represent_mapping(
+                "tag:yaml.org,2002:map", data.items(), data.fa.flow_style()
+            )
+
+        def represent_commented_seq(self, data: Any) -> Any:
+            return self.represent_sequence(
+                "tag:yaml.org,2002:seq", data, data.fa.flow_style()
+            )
+
+        def represent_none(self, data: Any) -> Any:
+            # ruamel.yaml writes None as an empty value, e.g., for the section keys
+            return self.represent_scalar("tag:yaml.org,2002:null", "")
+
+        def represent_conversion_class(self, data: Any) -> Any:
+            return data.to_yaml(self, data)
+
+    LibYAMLDumper.add_representer(
+        yaml.comments.CommentedMap, LibYAMLDumper.represent_commented_map
+    )
+    LibYAMLDumper.add_representer(
+        yaml.comments.CommentedSeq, LibYAMLDumper.represent_commented_seq
+    )
+    LibYAMLDumper.add_representer(type(None), LibYAMLDumper.represent_none)
+    LibYAMLDumper.add_representer(float, represent_float)
+    for cl in CONVERSION_CLASSES:
+        LibYAMLDumper.add_representer(cl, LibYAMLDumper.represent_conversion_class)
+    del cl
+
+
+class LibYAMLEmitter:
+    """Serialize data to YAML with `LibYAMLDumper`.
+
+    This has the same ``dump`` method as a ruamel.yaml emitter, so the two can be used
+    interchangeably by `convert`.
+    """
+
+    def dump(self, data: Any, stream: Any) -> None:
+        pyyaml.dump(
+            data,
+            stream,
+            Dumper=LibYAMLDumper,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+        )
+
+
+def create_emitter() -> Union[yaml.YAML, LibYAMLEmitter]:
+    """Create an emitter that can serialize the conversion classes.
+
+    If PyYAML >= 5.1 is installed with its LibYAML bindings, a `LibYAMLEmitter` is
+    returned. Otherwise, a ruamel.yaml emitter is used. The two emitters produce
+    equivalent YAML documents, although long lists may be wrapped differently.
+    """
+    if CSafeDumper is not None:
+        return LibYAMLEmitter()
+    emitter = yaml.YAML()
+    for cl in CONVERSION_CLASSES:
+        emitter.register_class(cl)
+    return emitter
+
+
+# Number of species or reactions serialized by each task when writing in parallel
+PARALLEL_CHUNK_SIZE = 64
+
+
+def dump_entries(entries: Union[List[Species], List[Reaction]]) -> str:
+    """Serialize a list of species or reactions to YAML text.
+
+    :param entries:
+        A list of `Species` or `Reaction` instances.
+
+    Returns the YAML block sequence items for the entries, without a key. This is used
+    by `convert` to serialize chunks of a list of species or reactions in separate
+    processes, so it only depends on its argument.
+    """
+    emitter = create_emitter()
+    stream = io.StringIO()
+    for entry in entries:
+        emitter.dump([entry], stream)
+    return stream.getvalue()
+
+
 def convert(
-    inpfile: Union[str, Path] = None,
-    outfile: Union[str, Path] = None,
-    text: str = None,
+    inpfile: Optional[Union[str, Path]] = None,
+    outfile: Optional[Union[str, Path]] = None,
+    text: Optional[str] = None,
+    processes: Optional[int] = 1,
 ) -> None:
     """Convert an input legacy CTML file to a YAML file.
 
@@ -2525,10 +2905,20 @@ def convert(
     :param text:
         Contains a string with the CTML input file content. Exclusive with ``inpfile``,
         only one of the two can be specified.
+    :param processes:
+        The number of worker processes used to write the species and reactions to
+        YAML, which takes most of the run time for large mechanisms. The default, 1,
+        does all of the work in the current process. If `None`, the number of
+        processors on the machine is used. Otherwise, it must be a positive integer.
+        Writing in parallel is experimental; its speedup has not been measured yet.
 
     All files are assumed to be relative to the current working directory of the Python
     process running this script.
     """
+    if processes is not None and processes < 1:
+        raise ValueError(
+            "'processes' must be a positive integer or None, not {}.".format(processes)
+        )
     if inpfile is not None and text is not None:
         raise ValueError("Only one of 'inpfile' or 'text' should be specified.")
     elif inpfile is not None:
@@ -2553,41 +2943,32 @@ def convert(
     # According to https://stackoverflow.com/a/1091953 there are 5 escaped
     # characters in XML: " (&quot;), ' (&apos;), & (&amp;), < (&lt;), and >
     # (&gt;). This code only replaces & not followed by one of the escaped
-    # character codes.
-    ctml_text = re.sub("&(?!amp;|quot;|apos;|lt;|gt;)", "&amp;", ctml_text)
-    ctml_tree = etree.fromstring(ctml_text)
-
-    species_data = create_species_from_data_node(ctml_tree)
-    reaction_data = create_reactions_from_data_node(ctml_tree)
+    # character codes. Most files don't have any ampersands at all, in which case the
+    # regular expression pass over the whole text can be skipped.
+    if "&" in ctml_text:
+        ctml_text = re.sub("&(?!amp;|quot;|apos;|lt;|gt;)", "&amp;", ctml_text)
+    ctml_tree, species_data, reaction_data = parse_ctml(ctml_text)
     phases = create_phases_from_data_node(ctml_tree, species_data, reaction_data)
 
     # This should be done after phase processing
-    output_species = BlockMap({})
+    output_sections = []  # type: List[Tuple[str, Union[List[Species], List[Reaction]]]]
     for species_node_id, species_list in species_data.items():
         if not species_list:
             continue
         if species_node_id == "species_data":
             species_node_id = "species"
-        output_species[species_node_id] = species_list
-        output_species.yaml_set_comment_before_after_key(species_node_id, before="\n")
+        output_sections.append((species_node_id, species_list))
 
-    output_reactions = BlockMap({})
     for reaction_node_id, reaction_list in reaction_data.items():
         if not reaction_list:
             continue
         if reaction_node_id == "reaction_data":
             reaction_node_id = "reactions"
-        output_reactions[reaction_node_id] = reaction_list
-        output_reactions.yaml_set_comment_before_after_key(
-            reaction_node_id, before="\n"
-        )
+        output_sections.append((reaction_node_id, reaction_list))
 
     output_phases = BlockMap({"phases": phases})
-    output_phases.yaml_set_comment_before_after_key("phases", before="\n")
 
-    emitter = yaml.YAML()
-    for cl in [Phase, Species, SpeciesThermo, SpeciesTransport, Reaction]:
-        emitter.register_class(cl)
+    emitter = create_emitter()
 
     metadata = BlockMap(
         {
@@ -2598,13 +2979,39 @@ def convert(
     )
     if inpfile is not None:
         metadata["input-files"] = FlowList([str(inpfile)])
-    with Path(outfile).open("w") as output_file:
-        emitter.dump(metadata, output_file)
-        emitter.dump(output_phases, output_file)
-        if output_species:
-            emitter.dump(output_species, output_file)
-        if output_reactions:
-            emitter.dump(output_reactions, output_file)
+
+    executor = None
+    if processes != 1:
+        executor = ProcessPoolExecutor(processes)
+    try:
+        with Path(outfile).open("w") as output_file:
+            emitter.dump(metadata, output_file)
+            output_file.write("\n")
+            emitter.dump(output_phases, output_file)
+            for section_id, section in output_sections:
+                # Dumping the key with an empty value lets the emitter quote it if
+                # necessary
+                output_file.write("\n")
+                emitter.dump(BlockMap({section_id: None}), output_file)
+                if executor is None:
+                    # Entries are written one at a time, so that the emitter only
+                    # holds the representation of a single entry in memory instead of
+                    # the representation of the entire list.
+                    for entry in section:
+                        emitter.dump([entry], output_file)
+                else:
+                    # Serialize chunks of entries in parallel. map returns the
+                    # results in the order of the input, so the output file is the
+                    # same as the one written by a single process.
+                    chunks = [
+                        section[i : i + PARALLEL_CHUNK_SIZE]
+                        for i in range(0, len(section), PARALLEL_CHUNK_SIZE)
+                    ]
+                    for chunk_text in executor.map(dump_entries, chunks):
+                        output_file.write(chunk_text)
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
 
 def main():
@@ -2619,23 +3026,29 @@ def main():
     )
     parser.add_argument("input", help="The input CTML filename. Must be specified.")
     parser.add_argument("output", nargs="?", help="The output YAML filename. Optional.")
-    if len(sys.argv) not in [2, 3]:
-        if len(sys.argv) > 3:
-            print(
-                "ctml2yaml.py: error: unrecognized arguments:",
-                ' '.join(sys.argv[3:]),
-                file=sys.stderr,
-            )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help=(
+            "The number of worker processes used to write the species and reactions. "
+            "Use 0 for the number of processors on the machine. Default: 1."
+        ),
+    )
+    # argparse reports any other errors in the arguments
+    if len(sys.argv) == 1:
         parser.print_help(sys.stderr)
         sys.exit(1)
     args = parser.parse_args()
+    if args.processes < 0:
+        parser.error("argument --processes: must not be negative")
     input_file = Path(args.input)
     if args.output is None:
         output_file = input_file.with_suffix(".yaml")
     else:
         output_file = Path(args.output)
 
-    convert(input_file, output_file)
+    convert(input_file, output_file, processes=args.processes or None)
 
 
 if __name__ == "__main__":
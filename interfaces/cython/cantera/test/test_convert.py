@@ -2,6 +2,8 @@ import os
 from os.path import join as pjoin
 import itertools
 from pathlib import Path
+import importlib.util
+from unittest import mock
 
 from . import utilities
 import cantera as ct
@@ -1020,6 +1022,44 @@ class ctml2yamlTest(utilities.CanteraTest):
         self.checkThermo(ctmlGas, yamlGas, [300, 500, 1300, 2000])
         self.checkKinetics(ctmlGas, yamlGas, [900, 1800], [2e5, 20e5])
 
+    def test_chemically_activated_type_spelling(self):
+        # type="chemically_activated" is processed the same as type="chemAct"
+        ctml_text = Path(self.test_data_dir).joinpath(
+            "chemically-activated-reaction.xml"
+        ).read_text()
+        yml = {}
+        for name, reaction_type in [
+            ("chemact", "chemAct"),
+            ("chemically-activated", "chemically_activated"),
+        ]:
+            output_file = Path(self.test_work_dir).joinpath(name + "-spelling.yaml")
+            ctml2yaml.convert(
+                text=ctml_text.replace(
+                    'type="chemAct"', 'type="{}"'.format(reaction_type)
+                ),
+                outfile=output_file,
+            )
+            with output_file.open() as stream:
+                yml[name] = yaml.safe_load(stream)
+        self.assertEqual(
+            yml["chemact"]["reactions"], yml["chemically-activated"]["reactions"]
+        )
+        self.assertEqual(
+            yml["chemically-activated"]["reactions"][0]["type"],
+            "chemically-activated",
+        )
+
+    def test_malformed_efficiencies(self):
+        ctml_text = Path(self.cantera_data).joinpath("gri30.xml").read_text()
+        ctml_text = ctml_text.replace(
+            '<efficiencies default="1.0">', '<efficiencies default="1.0">1.5 ', 1
+        )
+        with self.assertRaisesRegex(ValueError, "not a species:value pair"):
+            ctml2yaml.convert(
+                text=ctml_text,
+                outfile=Path(self.test_work_dir).joinpath("gri30-efficiencies.yaml"),
+            )
+
     def test_explicit_forward_order(self):
         ctml2yaml.convert(
             Path(self.test_data_dir).joinpath("explicit-forward-order.xml"),
@@ -1294,3 +1334,78 @@ class ctml2yamlTest(utilities.CanteraTest):
                     Path(self.test_data_dir).joinpath("duplicate-reactionData-ids.xml"),
                     Path(self.test_work_dir).joinpath("duplicate-reactionData-ids.yaml")
                 )
+
+    def test_parallel_output(self):
+        serial_file = Path(self.test_work_dir).joinpath("gri30-serial.yaml")
+        parallel_file = Path(self.test_work_dir).joinpath("gri30-parallel.yaml")
+        ctml2yaml.convert(Path(self.cantera_data).joinpath("gri30.xml"), serial_file)
+        ctml2yaml.convert(
+            Path(self.cantera_data).joinpath("gri30.xml"), parallel_file, processes=2
+        )
+        # The output files should only differ in the time stamp
+        serial = [line for line in serial_file.read_text().splitlines()
+                  if not line.startswith("date:")]
+        parallel = [line for line in parallel_file.read_text().splitlines()
+                    if not line.startswith("date:")]
+        self.assertEqual(serial, parallel)
+
+    def test_invalid_processes(self):
+        for processes in [0, -1]:
+            with self.assertRaisesRegex(ValueError, "positive integer or None"):
+                ctml2yaml.convert(
+                    Path(self.cantera_data).joinpath("gri30.xml"),
+                    Path(self.test_work_dir).joinpath("gri30-processes.yaml"),
+                    processes=processes,
+                )
+
+    def test_declared_encoding(self):
+        # The text is decoded when the file is read, so the encoding named in the XML
+        # declaration must not be applied to it a second time
+        ctml_text = Path(self.cantera_data).joinpath("h2o2.xml").read_text()
+        ctml_text = ctml_text.replace(
+            '<?xml version="1.0"?>', '<?xml version="1.0" encoding="ISO-8859-1"?>', 1
+        )
+        ctml_text = ctml_text.replace(
+            '<species name="H2">', '<species name="H2"><note>Température</note>', 1
+        )
+        output_file = Path(self.test_work_dir).joinpath("h2o2-encoding.yaml")
+        ctml2yaml.convert(text=ctml_text, outfile=output_file)
+        with output_file.open() as stream:
+            yml = yaml.safe_load(stream)
+        self.assertEqual(yml["species"][0]["note"], "Température")
+
+    def load_converted(self, converter, name, input_file):
+        output_file = Path(self.test_work_dir).joinpath(name + ".yaml")
+        converter.convert(input_file, output_file)
+        with output_file.open() as stream:
+            yml = yaml.safe_load(stream)
+        del yml["date"]
+        return yml
+
+    def check_fallback(self, name, converter):
+        for input_file in [
+            Path(self.cantera_data).joinpath("gri30.xml"),
+            Path(self.cantera_data).joinpath("ptcombust.xml"),
+            Path(self.test_data_dir).joinpath("pdep-test.xml"),
+            Path(self.test_data_dir).joinpath("co2_RK_example.xml"),
+        ]:
+            default = self.load_converted(ctml2yaml, "default", input_file)
+            fallback = self.load_converted(converter, name, input_file)
+            self.assertEqual(default, fallback, msg=input_file.name)
+
+    def test_ruamel_emitter(self):
+        # The YAML output is written with PyYAML if it is available. The output of the
+        # ruamel.yaml emitter must load to the same data.
+        with mock.patch.object(ctml2yaml, "CSafeDumper", None):
+            self.assertIsInstance(ctml2yaml.create_emitter(), yaml.YAML)
+            self.check_fallback("ruamel-emitter", ctml2yaml)
+
+    def test_elementtree_parser(self):
+        # The CTML file is parsed with lxml if it is available. Load a separate copy
+        # of the module that has to use ElementTree instead.
+        spec = importlib.util.find_spec("cantera.ctml2yaml")
+        converter = importlib.util.module_from_spec(spec)
+        with mock.patch.dict("sys.modules", {"lxml": None, "lxml.etree": None}):
+            spec.loader.exec_module(converter)
+        self.assertEqual(converter.etree.__name__, "xml.etree.ElementTree")
+        self.check_fallback("elementtree-parser", converter)